@@ -0,0 +1,23 @@
+"""
+Internal helpers shared by the per-type dispatch tables in equality and hashing.
+"""
+from .pytypes import SingletonObjects
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from typing import Any, Dict
+
+
+# Ids of the singleton objects, so checking if an object is a singleton is a single set lookup
+SINGLETON_IDS = frozenset(id(x) for x in SingletonObjects)
+
+
+def cache_exact_type(cache: 'Dict[type, Any]', obj: 'Any', value: 'Any', max_size: 'int') -> None:
+    """Stores `value` in the dictionary `cache` under the exact type of `obj`
+
+    Objects can lie about their class (EG: proxies), in which case isinstance() may not be determined by the type alone,
+    so those are never cached. The cache is also bounded to `max_size` types in case many are being created dynamically.
+    """
+    if obj.__class__ is type(obj) and len(cache) < max_size:
+        cache[type(obj)] = value
@@ -24,9 +24,15 @@ Future planned types:
     - more builtin types, both C and Python ones
 """
 
+import ast
+import functools
+import itertools
 import numpy as np
+import reprlib
+from collections import Counter
 from enum import Enum
-from .pytypes import GeneratorType, DictKeysType, DictValuesType, SingletonObjects
+from .pytypes import GeneratorType, DictKeysType, DictValuesType, NoneType, EllipsisType, NotImplementedType
+from ._dispatch import SINGLETON_IDS, cache_exact_type
 from typing import TYPE_CHECKING
 
 
@@ -35,30 +41,49 @@ if TYPE_CHECKING:
 
 
 _MAX_STR_LEN = 1000
+_MAX_CONTAINER_REPR_LEN = 20
+
+# Repr used for objects in error messages. Builtin containers are truncated while they are traversed, but other objects
+# still have their full repr() built before being cut down to _MAX_STR_LEN characters
+_LIMITED_REPR = reprlib.Repr()
+_LIMITED_REPR.maxstring = _LIMITED_REPR.maxother = _LIMITED_REPR.maxlong = _MAX_STR_LEN
+_LIMITED_REPR.maxlist = _LIMITED_REPR.maxtuple = _LIMITED_REPR.maxarray = _LIMITED_REPR.maxdict = _MAX_CONTAINER_REPR_LEN
+_LIMITED_REPR.maxset = _LIMITED_REPR.maxfrozenset = _LIMITED_REPR.maxdeque = _MAX_CONTAINER_REPR_LEN
+
+# ast.Index/ast.ExtSlice only exist (and wrap subscripts) in older versions of python
+_AST_INDEX = getattr(ast, 'Index', None)
+_AST_EXT_SLICE = getattr(ast, 'ExtSlice', None)
 
 # Types that are all able to be checked against one another using default '==' equality check
 _DUNDER_EQ_TYPES = (int, float, np.number, complex, bytes, bytearray, memoryview, str, range, type, set, frozenset, DictKeysType)
 
+# The exact (non-abstract) types from _DUNDER_EQ_TYPES, for quick membership checks on type(obj)
+_DUNDER_EQ_EXACT_TYPES = frozenset(_DUNDER_EQ_TYPES) - {np.number}
+
+# Bytes types that can be compared directly against one another (memoryviews may have non-byte formats, so they are
+# left to the generic '==' check)
+_BYTES_TYPES = (bytes, bytearray)
+
+# Numpy dtype kinds (bool, int, uint, float, complex) that can be checked for equality entirely within numpy
+_NUMERIC_DTYPE_KINDS = frozenset('biufc')
+
+# Element types for which python's builtin sequence '==' is equivalent to equal() on sequences of that exact type
+_FAST_SEQUENCE_TYPES = frozenset({bool, int, float, complex, str, bytes})
+
+# Numeric element types that may be mixed within a sequence and still compared with python's builtin '==' (so long as
+# `strict_types=False`), since equal() considers equal numbers of different types to be equal
+_NUMERIC_SEQUENCE_TYPES = frozenset({int, float, complex})
+
 # Keep track of the current kwargs being used in equal()
 _CURR_EQUAL_KWARGS = None
 _EQ_DEFAULT_STRICT_TYPES = object()
 _EQ_DEFAULT_UNORDERED = object()
 
+# Maximum number of types to keep in _EQUAL_DISPATCH
+_MAX_EQUAL_DISPATCH_SIZE = 1024
 
-# Context manager to return _CURR_EQUAL_KWARGS back to expected
-class _ReturnCurrEqualKwargs:
-    def __init__(self, kwargs):
-        self.kwargs = kwargs
-    def __enter__(self):
-        return self
-    def __exit__(self, *args):
-        global _CURR_EQUAL_KWARGS
-        if self.kwargs['control_kwargs']:
-            _CURR_EQUAL_KWARGS = None
-        else:
-            for k in self.kwargs:
-                if k.startswith('prev_'):
-                    _CURR_EQUAL_KWARGS[k[len('prev_'):]] = self.kwargs[k]
+# Fill value for sequences that ran out of elements while being compared
+_MISSING = object()
 
 
 def equal(a: 'Any', b: 'Any', selector: 'Optional[str]' = None, strict_types: 'bool' = _EQ_DEFAULT_STRICT_TYPES, 
@@ -85,13 +110,17 @@ def equal(a: 'Any', b: 'Any', selector: 'Optional[str]' = None, strict_types: 'b
         b (Any): object to check equality
         selector (Optional[str]): if not None, then a string that determines the 'selector' to use on both objects for
             determining equality. It should start with either a letter (case-sensitive), underscore '_', dot '.' or
-            bracket '['. This string will essentially be appended to each object to get some attribute to determine
-            equality of instead of the objects themselves. For example, if you have two lists, but only want to check
-            if their element at index '2' are equal, you could pass `selector='[2]'`. This is useful for debugging purposes
-            as the error messages on unequal objects will be far more informative. Defaults to None.
+            bracket '['. The selector is applied to each object to get some sub-object to determine equality of
+            instead of the objects themselves. For example, if you have two lists, but only want to check if their
+            element at index '2' are equal, you could pass `selector='[2]'`. This is useful for debugging purposes as
+            the error messages on unequal objects will be far more informative. Defaults to None.
 
-            NOTE: if you pass a `selector` string that starts with an alphabetical character, it will be assumed to be
-            an attribute, and this will check equality on `a.SELECTOR` and `b.SELECTOR`
+            The selector may only be a chain of attribute accesses (EG: '.thing') and subscripts whose keys are
+            literals (EG: '[2]', "['key']", '[1:-1]', '[0, 1:]'), such as ".thing['key'][0, 1:]". Anything else
+            (function calls like '.keys()', names or expressions inside subscripts, etc.) raises a ValueError.
+
+            NOTE: if you pass a `selector` string that starts with an alphabetical character or underscore, it will be
+            assumed to be an attribute, and this will check equality on `a.SELECTOR` and `b.SELECTOR`
         strict_types (bool): if True, then the types of both objects must exactly match. Otherwise objects which are 
             equal but of different types will be considered equal. Defaults to False.
         unordered (bool): if True, then all known sequential objects (list, tuple, numpy array, etc.) will be considered
@@ -103,44 +132,39 @@ def equal(a: 'Any', b: 'Any', selector: 'Optional[str]' = None, strict_types: 'b
     """
     # Check if we are the first call and thus should controll the kwargs
     global _CURR_EQUAL_KWARGS
-    _stack_kwargs = {'raise_err': raise_err, 'control_kwargs': False}
-    if _CURR_EQUAL_KWARGS is None:
-        _stack_kwargs['control_kwargs'] = True
-        _CURR_EQUAL_KWARGS = {'strict_types': False, 'unordered': False}
+    curr_kwargs = _CURR_EQUAL_KWARGS
+    control_kwargs = curr_kwargs is None
+    if control_kwargs:
+        curr_kwargs = _CURR_EQUAL_KWARGS = {'strict_types': False, 'unordered': False, 'memo': {}, 'memo_cycle_hits': 0}
     
     # Update the kwargs if needed, otherwise grab them from the curr kwargs
-    _stack_kwargs.update({'prev_strict_types': _CURR_EQUAL_KWARGS['strict_types'], 'prev_unordered': _CURR_EQUAL_KWARGS['unordered']})
-    if strict_types is not _EQ_DEFAULT_STRICT_TYPES:
-        _CURR_EQUAL_KWARGS['strict_types'] = strict_types
-    else:
-        strict_types = _CURR_EQUAL_KWARGS['strict_types']
-    
-    if unordered is not _EQ_DEFAULT_UNORDERED:
-        _CURR_EQUAL_KWARGS['unordered'] = unordered
-    else:
-        unordered = _CURR_EQUAL_KWARGS['unordered']
+    prev_strict_types, prev_unordered = curr_kwargs['strict_types'], curr_kwargs['unordered']
+    if strict_types is _EQ_DEFAULT_STRICT_TYPES:
+        strict_types = prev_strict_types
+    if unordered is _EQ_DEFAULT_UNORDERED:
+        unordered = prev_unordered
+    curr_kwargs['strict_types'], curr_kwargs['unordered'] = strict_types, unordered
+
+    # Always reset _CURR_EQUAL_KWARGS back to expected values once we are done
+    try:
 
-    # Cover with a context manager to reset _CURR_EQUAL_KWARGS back to expected values
-    with _ReturnCurrEqualKwargs(_stack_kwargs):
-        
         # Get the right selector, raising an error if it's bad
         if selector is not None:
             if not isinstance(selector, str):
                 raise TypeError("`selector` arg must be str, not %s" % repr(type(selector).__name__))
             if selector == '':
                 selector = None
-            elif selector[0].isalpha():
-                selector = '.' + selector
-            elif selector[0] not in '._[':
+            elif not selector[0].isalpha() and selector[0] not in '._[':
                 raise ValueError("`selector` string must start with a '.', '_', '[', or alphabetic character: %s" % repr(selector))
         
         # Use `selector` if needed
         if selector is not None:
+            selector_ops = _compile_selector(selector)
             try:
                 _failed_obj_name = 'a'
-                _check_a = eval('a' + selector)
+                _check_a = _apply_selector(a, selector_ops)
                 _failed_obj_name = 'b'
-                _check_b = eval('b' + selector)
+                _check_b = _apply_selector(b, selector_ops)
                 _failed_obj_name = None
 
                 return equal(_check_a, _check_b, selector=None, strict_types=strict_types, unordered=unordered, raise_err=raise_err)
@@ -152,163 +176,447 @@ def equal(a: 'Any', b: 'Any', selector: 'Optional[str]' = None, strict_types: 'b
                         (repr(selector), _limit_str(a), _limit_str(b)))
                 raise EqualityCheckingError("Could not use `selector` with value %s on object `%s`" % (repr(selector), _failed_obj_name))
 
-        # Wrap everything in a try/catch in case there is an error, so it will be easier to spot
-        try:
+        return _equal(a, b, strict_types, unordered, raise_err)
+    finally:
+        if control_kwargs:
+            _CURR_EQUAL_KWARGS = None
+        else:
+            curr_kwargs['strict_types'], curr_kwargs['unordered'] = prev_strict_types, prev_unordered
 
-            # Do a quick first check for 'is' as they should always be equal, no matter what
-            if a is b:
-                return True
-            
-            # Check if there are strict types
-            if strict_types and type(a) != type(b):
-                return _eq_check(False, a, b, raise_err, message='Objects are of different types and `strict_types=True`.')
-            
-            ##################
-            # Checking types #
-            ##################
 
-            # We already checked 'is', so this must be an error
-            if any(a is x for x in SingletonObjects) or isinstance(a, Enum):
-                return _eq_check(False, a, b, raise_err)
-            
-            # Check for bool first that way int's and bool's cannot be equal
-            elif isinstance(a, bool) or isinstance(b, bool):
-                # Enforce that this is a bool no matter what. Bool's are NOT int's. I will die on this hill...
-                if not _eq_enforce_types(bool, a, b, raise_err):
-                    return False
-                return _eq_check(a == b, a, b, raise_err, message=None)
-            
-            # Check for objects using '=='
-            elif isinstance(a, _DUNDER_EQ_TYPES):
-                if not _eq_enforce_types(_DUNDER_EQ_TYPES, a, b, raise_err):
+def _equal(a, b, strict_types, unordered, raise_err):
+    """Checks equality of `a` and `b` using already-resolved kwargs
+    
+    Handlers call this directly for sub-objects, skipping the kwargs management and `selector` handling in equal(). This
+    is only valid while inside a call to equal() whose kwargs match the ones passed here (so that any custom __eq__
+    methods calling equal() inherit the correct kwargs).
+    """
+    # Wrap everything in a try/catch in case there is an error, so it will be easier to spot
+    try:
+
+        # Do a quick first check for 'is' as they should always be equal, no matter what
+        if a is b:
+            return True
+        
+        # Check if there are strict types
+        type_a = type(a)
+        if strict_types and type_a is not type(b):
+            return _eq_false_or_raise(a, b, raise_err, message='Objects are of different types and `strict_types=True`.')
+        
+        ##################
+        # Checking types #
+        ##################
+
+        # Check for bool first that way int's and bool's cannot be equal. Otherwise look up the handler for the exact
+        # type of `a`, only falling back to the slower isinstance() checks for subclasses and other unknown types
+        if isinstance(b, bool):
+            handler = _eq_bool
+        else:
+            handler = _EQUAL_DISPATCH.get(type_a, None)
+            if handler is None:
+                handler = _get_equal_handler(a)
+        
+        if handler in _MEMOIZED_HANDLERS:
+            return _equal_memoized(handler, a, b, strict_types, unordered, raise_err)
+        return handler(a, b, strict_types, unordered, raise_err)
+    
+    except EqualityError:
+        raise
+    except Exception:
+        raise EqualityCheckingError("Could not determine equality between objects\na: %s\nb: %s" % (_limit_str(a), _limit_str(b)))
+
+
+def _equal_memoized(handler, a, b, strict_types, unordered, raise_err):
+    """Calls the container `handler`, remembering which pairs of objects are equal for the rest of the top-level call
+    
+    Pairs that are currently being checked further up the stack are assumed to be equal, which allows self-referential
+    objects to be compared instead of recursing forever. Only True results are remembered, and only if they did not
+    depend on one of those assumptions (which could later turn out to be False). The objects themselves are kept in the
+    memo so their id()'s cannot be reused during the call.
+    """
+    memo = _CURR_EQUAL_KWARGS['memo']
+    key = (id(a), id(b), strict_types, unordered)
+    if key in memo:
+        if memo[key] is None:
+            _CURR_EQUAL_KWARGS['memo_cycle_hits'] += 1
+        return True
+    
+    memo[key] = None
+    cycle_hits = _CURR_EQUAL_KWARGS['memo_cycle_hits']
+    try:
+        ret = handler(a, b, strict_types, unordered, raise_err)
+    except BaseException:
+        del memo[key]
+        raise
+    
+    if ret and _CURR_EQUAL_KWARGS['memo_cycle_hits'] == cycle_hits:
+        memo[key] = (a, b)
+    else:
+        del memo[key]
+    return ret
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_selector(selector):
+    """Parses the given `selector` string into a tuple of (is_attribute, attribute_name_or_item_key) operations
+    
+    Selectors are parsed with the `ast` module instead of being passed to eval() every call. Only attribute access (EG:
+    '.thing') and subscripts with literal keys/indices/slices (EG: '[2]', "['key']", '[1:-1]') are allowed.
+    """
+    # Selectors that start with a letter or underscore are attributes
+    source = 'a' + ('.' + selector if selector[0].isalpha() or selector[0] == '_' else selector)
+
+    try:
+        node = ast.parse(source, mode='eval').body
+    except SyntaxError:
+        raise ValueError("Could not parse `selector` string: %s" % repr(selector))
+    
+    ops = []
+    while not isinstance(node, ast.Name):
+        if isinstance(node, ast.Attribute):
+            ops.append((True, node.attr))
+        elif isinstance(node, ast.Subscript):
+            ops.append((False, _selector_literal(node.slice, selector)))
+        else:
+            raise ValueError("`selector` string may only contain attribute access and subscripts: %s" % repr(selector))
+        node = node.value
+    
+    return tuple(reversed(ops))
+
+
+def _selector_literal(node, selector):
+    """Evaluates the literal subscript key `node` from a selector's parsed ast"""
+    # Python < 3.9 wraps subscripts in an ast.Index node
+    if _AST_INDEX is not None and isinstance(node, _AST_INDEX):
+        node = node.value
+    
+    # Multi-dimensional subscripts (EG: '[0, 1:]'). These are ast.ExtSlice's in python < 3.9 if they contain a slice
+    if _AST_EXT_SLICE is not None and isinstance(node, _AST_EXT_SLICE):
+        return tuple(_selector_literal(n, selector) for n in node.dims)
+    elif isinstance(node, ast.Tuple) and any(isinstance(n, ast.Slice) for n in node.elts):
+        return tuple(_selector_literal(n, selector) for n in node.elts)
+    
+    try:
+        if isinstance(node, ast.Slice):
+            return slice(*[None if n is None else ast.literal_eval(n) for n in (node.lower, node.upper, node.step)])
+        return ast.literal_eval(node)
+    except ValueError:
+        raise ValueError("`selector` subscripts must be literals: %s" % repr(selector))
+
+
+def _apply_selector(obj, ops):
+    """Applies the operations from _compile_selector() to the given object"""
+    for is_attr, key in ops:
+        obj = getattr(obj, key) if is_attr else obj[key]
+    return obj
+
+
+def _get_equal_handler(a):
+    """Returns the handler to use for checking equality of `a` when its exact type is not in _EQUAL_DISPATCH
+    
+    The handler is then cached in _EQUAL_DISPATCH for the exact type of `a`, that way these isinstance() checks only
+    happen once per type.
+    """
+    # We already checked 'is', so this must be an error
+    if id(a) in SINGLETON_IDS:
+        return _eq_identity
+    elif isinstance(a, Enum):
+        handler = _eq_identity
+    elif isinstance(a, _DUNDER_EQ_TYPES):
+        handler = _eq_dunder
+    elif isinstance(a, (list, tuple)):
+        handler = _eq_sequence
+    elif isinstance(a, np.ndarray):
+        handler = _eq_ndarray
+    elif isinstance(a, dict):
+        handler = _eq_dict
+    elif isinstance(a, DictValuesType):
+        handler = _eq_dict_values
+    else:
+        handler = _eq_default
+    
+    cache_exact_type(_EQUAL_DISPATCH, a, handler, _MAX_EQUAL_DISPATCH_SIZE)
+    return handler
+
+
+def _eq_identity(a, b, strict_types, unordered, raise_err):
+    """Objects that are only equal if `a is b`, which has already been checked (singletons, Enum's)"""
+    return _eq_false_or_raise(a, b, raise_err)
+
+
+def _eq_bool(a, b, strict_types, unordered, raise_err):
+    """Bool's are only ever equal to other bool's"""
+    # Enforce that this is a bool no matter what. Bool's are NOT int's. I will die on this hill...
+    if not _eq_enforce_types(bool, a, b, raise_err):
+        return False
+    return True if a == b else _eq_false_or_raise(a, b, raise_err)
+
+
+def _eq_dunder(a, b, strict_types, unordered, raise_err):
+    """Objects that can be checked against one another using '=='"""
+    # `a` is already known to be one of these types. Check the exact type of `b` first as it is a single set lookup
+    if type(b) not in _DUNDER_EQ_EXACT_TYPES and not _eq_enforce_types(_DUNDER_EQ_TYPES, a, b, raise_err):
+        return False
+    return True if a == b else _eq_false_or_raise(a, b, raise_err)
+
+
+def _eq_bytes(a, b, strict_types, unordered, raise_err):
+    """bytes/bytearray. Mismatched lengths are rejected before doing any comparison of the actual bytes"""
+    if type(b) not in _BYTES_TYPES:
+        return _eq_dunder(a, b, strict_types, unordered, raise_err)
+    if len(a) != len(b):
+        return _eq_false_or_raise(a, b, raise_err, message="Objects had different lengths: %d != %d" % (len(a), len(b)))
+    return True if a == b else _eq_false_or_raise(a, b, raise_err)
+
+
+def _eq_sequence(a, b, strict_types, unordered, raise_err):
+    """Sequences list/tuple"""
+    # Check that b is something that could be converted into a list/tuple nicely
+
+    # If check_b is a numpy array, convert check_a to one and do a numpy comparison
+    if isinstance(b, np.ndarray):
+        # Check if check_b is an object array, and if so, use lists, otherwise use numpy
+        if b.dtype == object:
+            return _check_with_conversion(a, None, b, list, unordered, raise_err, strict_types)
+        return _check_with_conversion(a, np.array, b, None, unordered, raise_err, strict_types)
+
+    # Check for things to convert to list. Ordered checks against generators can instead stop at the first difference
+    elif isinstance(b, (GeneratorType, DictKeysType)):
+        if not unordered and isinstance(b, GeneratorType):
+            return _eq_sequence_iterator(a, b, strict_types, raise_err)
+        return _check_with_conversion(a, None, b, list, unordered, raise_err)
+    
+    # Otherwise, make sure check_b is a list/tuple
+    elif not isinstance(b, (list, tuple)):
+        return _eq_false_or_raise(a, b, raise_err, message="checked b type could not be converted into list/tuple")
+    
+    # This is where we handle the actual checking.
+    # Check that they are the same length
+    if len(a) != len(b):
+        return _eq_false_or_raise(a, b, raise_err, message="Objects had different lengths: %d != %d" % (len(a), len(b)))
+    
+    # If we are using ordered, then we can just naively check, otherwise, we have to do some other things...
+    if not unordered:
+        # If every element in both sequences is of the exact same simple type (or all are plain numbers), then python's
+        # own sequence comparison (which checks 'is' and then '==' on each element, just like we would) gives the same
+        # answer entirely in C. Only fall through to the elementwise loop if we need to find the differing index for an
+        # error message
+        if len(a) > 0 and _natively_comparable(a, b, strict_types):
+            if tuple(a) == tuple(b):
+                return True
+            elif not raise_err:
+                return False
+
+        # Check each element in the lists. If we aren't raising errors, we don't need to wrap each check to give more
+        # informative error messages, so keep the loop as tight as possible
+        if not raise_err:
+            for _checking_a, _checking_b in zip(a, b):
+                if not _equal(_checking_a, _checking_b, strict_types, unordered, False):
                     return False
-                return _eq_check(a == b, a, b, raise_err, message=None)
-            
-            # Check for sequences list/tuple
-            elif isinstance(a, (list, tuple)):
-                
-                # Check that b is something that could be converted into a list/tuple nicely
-
-                # If check_b is a numpy array, convert check_a to one and do a numpy comparison
-                if isinstance(b, np.ndarray):
-                    # Check if check_b is an object array, and if so, use lists, otherwise use numpy
-                    if b.dtype == object:
-                        return _check_with_conversion(a, None, b, list, unordered, raise_err, strict_types)
-                    return _check_with_conversion(a, np.ndarray, b, None, unordered, raise_err)
-
-                # Check for things to convert to list
-                elif isinstance(b, (GeneratorType, DictKeysType)):
-                    return _check_with_conversion(a, None, b, list, unordered, raise_err)
-                
-                # Otherwise, make sure check_b is a list/tuple
-                elif not isinstance(b, (list, tuple)):
-                    return _eq_check(False, a, b, raise_err, message="checked b type could not be converted into list/tuple")
-                
-                # This is where we handle the actual checking.
-                # Check that they are the same length
-                if len(a) != len(b):
-                    return _eq_check(False, a, b, raise_err, message="Objects had different lengths: %d != %d" % (len(a), len(b)))
-                
-                # If we are using ordered, then we can just naively check, otherwise, we have to do some other things...
-                if not unordered:
-                    # Check each element in the lists
-                    for i, (_checking_a, _checking_b) in enumerate(zip(a, b)):
-                        try:
-                            # It will have returned an error if raise_err, so just return False
-                            if not equal(_checking_a, _checking_b, selector=None, strict_types=strict_types, unordered=unordered, raise_err=raise_err):
-                                return False
-                        except EqualityError:  # If we get an equality error, then raise_err must be true
-                            raise EqualityError(a, b, "Values at index %d were not equal" % i)
-                        except Exception:
-                            raise EqualityCheckingError("Could not determine equality between elements at index %d" % i)
-                    
-                    # Now we can return True
-                    return True
-
-                # Unordered list checking
-                else:
-                    raise NotImplementedError
-            
-            # Check for numpy array
-            elif isinstance(a, np.ndarray):
-
-                # Ensure the other value can be converted into an array
-                if not isinstance(b, np.ndarray):
-                    # If check_a is an object array, then just convert it to a list now and have that check it
-                    if a.dtype == object:
-                        return _check_with_conversion(a, list, b, None, unordered, raise_err, strict_types)
-                    
-                    # Otherwise, if it is a known convertible, convert it
-                    if isinstance(b, (list, tuple, GeneratorType)):
-                        return _check_with_conversion(a, None, b, np.array, unordered, raise_err, strict_types)
-                    
-                    # Otherwise, assume not equal
-                    return _eq_check(False, a, b, raise_err, message="Could not convert b object of type %s to numpy array" % type(b).__name__)
-
-                # Check if we are using objects or a different dtype
-                if a.dtype == object:
-                    # Attempt to check using lists at this point
-                    return _check_with_conversion(a, list, b, list, unordered, raise_err, strict_types)
-
-                # Otherwise, check if we are doing unordered or ordered.
-                if not unordered:
-                    # we can use the builtin numpy assert equal thing
-                    try:
-                        np.testing.assert_equal(a, b)
-                        return True
-                    except AssertionError as e:
-                        return _eq_check(False, a, b, raise_err, message='Numpy assert_equal found discrepancies:\n%s' % e)
-                
-                # Otherwise we need to do an unordered equality check. Just convert to a list at this point and check it
-                else:
-                    return _check_with_conversion(a, list, b, list, unordered, raise_err, strict_types)
-            
-            # Check for dictionaries
-            elif isinstance(a, dict):
-                # b must be a dictionary
-                if not _eq_enforce_types(dict, a, b, raise_err, message='Dictionaries must be same type to compare'):
+            return True
+
+        for i, (_checking_a, _checking_b) in enumerate(zip(a, b)):
+            try:
+                # It will have returned an error if raise_err, so just return False
+                if not _equal(_checking_a, _checking_b, strict_types, unordered, raise_err):
                     return False
-                
-                # Check all the keys are the same
-                try:
-                    if not equal(a.keys(), b.keys(), selector=None, strict_types=strict_types, unordered=unordered, raise_err=raise_err):
-                        return False
-                except EqualityError:  # If we get an equality error, then raise_err must be true
-                    raise EqualityError(a, b, message="Dictionaries had different .keys()")
-                except Exception:
-                    raise EqualityCheckingError("Could not determine equality between dictionary keys\na: %s\nb: %s" %
-                        (_limit_str(a.keys()), _limit_str(b.keys())))
-                
-                # Check all the values are the same
-                for k in a:
-                    try:
-                        if not equal(a[k], b[k], selector=None, strict_types=strict_types, unordered=unordered, raise_err=raise_err):
-                            return False
-                    except EqualityError:  # If we get an equality error, then raise_err must be true
-                        raise EqualityError(a, b, message="Values at key %s differ" % repr(k))
-                    except Exception:
-                        raise EqualityCheckingError("Could not determine equality between dictionary values at key %s" % repr(k))
-                
-                # Now we can return True
+            except EqualityError:  # If we get an equality error, then raise_err must be true
+                raise EqualityError(a, b, "Values at index %d were not equal" % i)
+            except Exception:
+                raise EqualityCheckingError("Could not determine equality between elements at index %d" % i)
+        
+        # Now we can return True
+        return True
+
+    # Unordered list checking
+    else:
+        return _eq_unordered_sequence(a, b, strict_types, raise_err)
+
+
+def _eq_sequence_iterator(a, b, strict_types, raise_err):
+    """Checks that the list/tuple `a` has the same elements in the same order as the iterator `b`
+    
+    Elements are pulled from `b` one at a time, so it is never converted into a list and is only consumed up to the first
+    difference.
+    """
+    for i, (_checking_a, _checking_b) in enumerate(itertools.zip_longest(a, b, fillvalue=_MISSING)):
+        if _checking_a is _MISSING or _checking_b is _MISSING:
+            return _eq_false_or_raise(a, b, raise_err, message="Objects had different lengths")
+        try:
+            if not _equal(_checking_a, _checking_b, strict_types, False, raise_err):
+                return False
+        except EqualityError:  # If we get an equality error, then raise_err must be true
+            raise EqualityError(a, b, "Values at index %d were not equal" % i)
+    
+    return True
+
+
+def _eq_unordered_sequence(a, b, strict_types, raise_err):
+    """Checks that the same-length sequences `a` and `b` contain the same elements (including multiplicity) in any order
+    
+    If every element in both sequences is of the same exact simple type (or all are plain numbers), then the elements
+    are counted using a Counter, whose hashing/'==' agree with equal() for those types. Otherwise, each element in `a`
+    is matched against the remaining unmatched elements in `b` using equal(). Since equal() is an equivalence relation,
+    greedily taking the first match is always correct, but this is O(n^2).
+    """
+    if len(a) > 0 and _natively_comparable(a, b, strict_types):
+        return True if Counter(a) == Counter(b) else _eq_false_or_raise(a, b, raise_err, message="Sequences contained different elements")
+    
+    unmatched = list(b)
+    for i, _checking_a in enumerate(a):
+        for j, _checking_b in enumerate(unmatched):
+            if _equal(_checking_a, _checking_b, strict_types, True, False):
+                del unmatched[j]
+                break
+        else:
+            return _eq_false_or_raise(a, b, raise_err, message="No element in b was equal to the value at index %d" % i)
+    
+    return True
+
+
+def _eq_ndarray(a, b, strict_types, unordered, raise_err):
+    """Numpy arrays"""
+    # Ensure the other value can be converted into an array
+    if not isinstance(b, np.ndarray):
+        # If check_a is an object array, then just convert it to a list now and have that check it
+        if a.dtype == object:
+            return _check_with_conversion(a, list, b, None, unordered, raise_err, strict_types)
+        
+        # Otherwise, if it is a known convertible, convert it
+        if isinstance(b, (list, tuple, GeneratorType)):
+            return _check_with_conversion(a, None, b, np.array, unordered, raise_err, strict_types)
+        
+        # Otherwise, assume not equal
+        return _eq_false_or_raise(a, b, raise_err, message="Could not convert b object of type %s to numpy array" % type(b).__name__)
+
+    # Check if we are using objects or a different dtype
+    if a.dtype == object:
+        # Attempt to check using lists at this point
+        return _check_with_conversion(a, list, b, list, unordered, raise_err, strict_types)
+
+    # Numeric arrays can be checked entirely within numpy without needing assert_equal()'s exception machinery
+    if a.dtype.kind in _NUMERIC_DTYPE_KINDS and b.dtype.kind in _NUMERIC_DTYPE_KINDS:
+        if a.shape != b.shape:
+            return _eq_false_or_raise(a, b, raise_err, message="Arrays had different shapes: %s != %s" % (a.shape, b.shape))
+        
+        # 1-d unordered arrays can just be sorted. Higher dimensional ones need their sub-arrays checked as unordered
+        if unordered and a.ndim == 1:
+            a, b = np.sort(a), np.sort(b)
+        if not unordered or a.ndim <= 1:
+            eq = _np_numeric_equal_mask(a, b)
+            if eq.all():
                 return True
+            elif not raise_err:
+                return False
             
-            # Check for dict_values. These can call the equality with list and unordered 
-            elif isinstance(a, DictValuesType):
-                return _check_with_conversion(a, list, b, None, unordered=True, raise_err=raise_err, strict_types=strict_types)
-            
-            # Otherwise, use the default equality measure
-            else:
-                try:
-                    return _eq_check(a == b, a, b, raise_err, message='Using built-in __eq__ equality measure')
-                except EqualityError:  # If we get an equality error, then raise_err must be true
-                    raise EqualityError(a, b, message="Values were not equal using built-in __eq__ method")
-                except Exception:
-                    raise EqualityCheckingError("Could not determine equality between dictionary values using built-in __eq__ method")
-        
-        except EqualityError:
-            raise
+            # Only find where the arrays differ once we know we need an error message
+            if unordered:
+                return _eq_false_or_raise(a, b, raise_err, message="Arrays had different values")
+            index = tuple(int(i) for i in np.unravel_index(np.argmin(eq), eq.shape))
+            return _eq_false_or_raise(a, b, raise_err, message="Arrays had different values, first at index %s: %s != %s" %
+                (index, _limit_str(a[index]), _limit_str(b[index])))
+
+    # Otherwise, check if we are doing unordered or ordered.
+    if not unordered:
+        # we can use the builtin numpy assert equal thing
+        try:
+            np.testing.assert_equal(a, b)
+            return True
+        except AssertionError as e:
+            return _eq_false_or_raise(a, b, raise_err, message='Numpy assert_equal found discrepancies:\n%s' % e)
+    
+    # Otherwise we need to do an unordered equality check. Just convert to a list at this point and check it
+    else:
+        return _check_with_conversion(a, list, b, list, unordered, raise_err, strict_types)
+
+
+def _np_numeric_equal_mask(a, b):
+    """Elementwise equality of same-shape numeric arrays, considering nan's equal like np.testing.assert_equal()"""
+    # Check complex values by their real and imaginary parts separately, that way nan's only match in the same part
+    if a.dtype.kind == 'c' or b.dtype.kind == 'c':
+        return _np_numeric_equal_mask(a.real, b.real) & _np_numeric_equal_mask(a.imag, b.imag)
+    
+    eq = np.asarray(a == b)
+    if a.dtype.kind == 'f' and b.dtype.kind == 'f':
+        eq |= np.isnan(a) & np.isnan(b)
+    return eq
+
+
+def _eq_dict(a, b, strict_types, unordered, raise_err):
+    """Dictionaries"""
+    # b must be a dictionary
+    if not _eq_enforce_types(dict, a, b, raise_err, message='Dictionaries must be same type to compare'):
+        return False
+    
+    # Dictionaries of different lengths can never be equal
+    if len(a) != len(b):
+        return _eq_false_or_raise(a, b, raise_err, message="Dictionaries had different lengths: %d != %d" % (len(a), len(b)))
+    
+    # Check all the keys are the same. This is the same '==' check that equal() would do on the dict_keys, without the
+    # overhead of a recursive call
+    try:
+        keys_equal = a.keys() == b.keys()
+    except Exception:
+        raise EqualityCheckingError("Could not determine equality between dictionary keys\na: %s\nb: %s" %
+            (_limit_str(a.keys()), _limit_str(b.keys())))
+    if not keys_equal:
+        return _eq_false_or_raise(a, b, raise_err, message="Dictionaries had different .keys()")
+    
+    # Check all the values are the same, only wrapping each check with informative errors if we are raising them
+    b_getitem = b.__getitem__
+    if not raise_err:
+        for k, v in a.items():
+            if not _equal(v, b_getitem(k), strict_types, unordered, False):
+                return False
+        return True
+
+    for k, v in a.items():
+        try:
+            if not _equal(v, b_getitem(k), strict_types, unordered, raise_err):
+                return False
+        except EqualityError:  # If we get an equality error, then raise_err must be true
+            raise EqualityError(a, b, message="Values at key %s differ" % repr(k))
         except Exception:
-            raise EqualityCheckingError("Could not determine equality between objects\na: %s\nb: %s" % (_limit_str(a), _limit_str(b)))
+            raise EqualityCheckingError("Could not determine equality between dictionary values at key %s" % repr(k))
+    
+    # Now we can return True
+    return True
+
+
+def _eq_dict_values(a, b, strict_types, unordered, raise_err):
+    """dict_values. These can call the equality with list and unordered"""
+    return _check_with_conversion(a, list, b, list if isinstance(b, DictValuesType) else None, unordered=True, 
+        raise_err=raise_err, strict_types=strict_types)
+
+
+def _eq_default(a, b, strict_types, unordered, raise_err):
+    """Otherwise, use the default equality measure"""
+    try:
+        return True if a == b else _eq_false_or_raise(a, b, raise_err, message='Using built-in __eq__ equality measure')
+    except EqualityError:  # If we get an equality error, then raise_err must be true
+        raise EqualityError(a, b, message="Values were not equal using built-in __eq__ method")
+    except Exception:
+        raise EqualityCheckingError("Could not determine equality between dictionary values using built-in __eq__ method")
+
+
+# Maps exact types to their equality handlers. Types not in here (subclasses, numpy scalars, Enum's, etc.) have their
+# handler determined by _get_equal_handler(), which then adds them to this table (up to _MAX_EQUAL_DISPATCH_SIZE types)
+_EQUAL_DISPATCH = {
+    NoneType: _eq_identity,
+    EllipsisType: _eq_identity,
+    NotImplementedType: _eq_identity,
+    bool: _eq_bool,
+    list: _eq_sequence,
+    tuple: _eq_sequence,
+    np.ndarray: _eq_ndarray,
+    dict: _eq_dict,
+    DictValuesType: _eq_dict_values,
+}
+_EQUAL_DISPATCH.update(dict.fromkeys(_DUNDER_EQ_EXACT_TYPES, _eq_dunder))
+_EQUAL_DISPATCH.update(dict.fromkeys(_BYTES_TYPES, _eq_bytes))
+
+# Handlers for containers that may share sub-objects or contain themselves, whose results are memoized per call
+_MEMOIZED_HANDLERS = frozenset({_eq_sequence, _eq_dict})
 
 
 def _check_with_conversion(a, type_a, b, type_b, unordered, raise_err, strict_types=False):
@@ -333,7 +641,7 @@ def _check_with_conversion(a, type_a, b, type_b, unordered, raise_err, strict_ty
     except EqualityCheckingError:
         raise
     except Exception:
-        _eq_check(False, a, b, raise_err, message="Values were not equal %s" % conversion_str)
+        return _eq_false_or_raise(a, b, raise_err, message="Values were not equal %s" % conversion_str)
 
 
 def _get_check_type(t):
@@ -355,22 +663,32 @@ def _get_check_type(t):
 def _eq_enforce_types(types, a, b, raise_err, message=None):
     """enforces check_b is of the given types using isinstance"""
     if not isinstance(a, types) or not isinstance(b, types):
-        return _eq_check(False, a, b, raise_err, 'Objects were of incompatible types. %s' % message)
+        return _eq_false_or_raise(a, b, raise_err, 'Objects were of incompatible types. %s' % message)
     return True
 
 
-def _eq_check(checked, a, b, raise_err, message=None):
-    """bool equal check, determine whether or not we need to raise an error with info, or just return true/false"""
-    if not checked:
-        if raise_err:
-            raise EqualityError(a, b, message)
-        return False
-    return True
+def _natively_comparable(a, b, strict_types):
+    """Returns True if the non-empty sequences `a` and `b` only contain elements whose builtin '=='/hash agree with equal()
+    
+    This is the case if all elements are of the same exact type from _FAST_SEQUENCE_TYPES, or, if not using
+    `strict_types`, are all any of the exact types in _NUMERIC_SEQUENCE_TYPES.
+    """
+    types_a, types_b = set(map(type, a)), set(map(type, b))
+    if len(types_a) == 1 and types_a == types_b and type(a[0]) in _FAST_SEQUENCE_TYPES:
+        return True
+    return not strict_types and types_a <= _NUMERIC_SEQUENCE_TYPES and types_b <= _NUMERIC_SEQUENCE_TYPES
+
 
+def _eq_false_or_raise(a, b, raise_err, message=None):
+    """Called once `a` and `b` are known to be unequal. Raises an error with info if raise_err, otherwise returns False"""
+    if raise_err:
+        raise EqualityError(a, b, message)
+    return False
 
-def _limit_str(a, limit=_MAX_STR_LEN):
-    a_str = repr(a)
-    return a_str if len(a_str) < limit else (a[:limit] + '...')
+
+def _limit_str(a):
+    """Returns a repr() of `a` whose size is bounded while it is being built, rather than truncated afterwards"""
+    return _LIMITED_REPR.repr(a)
 
 
 class EqualityError(Exception):
@@ -380,6 +698,17 @@ class EqualityError(Exception):
         message = "Values are not equal" if message is None else message
         super().__init__("Object a (%s) is not equal to object b (%s)\na: %s\nb: %s\nMessage: %s" % \
             (repr(type(a).__name__), repr(type(b).__name__), _limit_str(a), _limit_str(b), message))
+    
+    def __reduce__(self):
+        # The default pickling would call __init__() with just the message, so rebuild from the message instead
+        return (_unpickle_equality_error, (type(self), self.args))
+
+
+def _unpickle_equality_error(cls, args):
+    """Recreates a pickled EqualityError from its already built message"""
+    err = cls.__new__(cls)
+    Exception.__init__(err, *args)
+    return err
 
 
 class EqualityCheckingError(Exception):
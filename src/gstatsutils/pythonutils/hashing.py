@@ -4,29 +4,80 @@ Utility functions involving hashing.
 Tested with the following types:
     - singleton objects (None, Ellipsis, NotImplemented, etc.)
     - int, float, complex, np.number
+    - str
+    - bytes, bytearray
+    - list, tuple (hashed the same as one another, like in equal())
     - Enum
 """
 
 import hashlib
+import importlib
 import numpy as np
+from collections import OrderedDict
 from enum import Enum
-from .pytypes import SingletonObjects
+from .pytypes import NoneType, EllipsisType, NotImplementedType
+from ._dispatch import SINGLETON_IDS, cache_exact_type
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
-    from typing import Any, Union
+    from typing import Any, Dict, Tuple, Union
 
 
-def hash_object(obj: 'Any', method: 'str' = 'sha256', ret_type: 'Union[type, str]' = str,
+# Default hashing method. BLAKE2b is considerably faster per byte than SHA-256 on CPUs without SHA extensions while
+# still being collision-resistant, which is all we need for identity/memoization hashing. It is only unavailable on
+# very old pythons, in which case we fall back to sha256
+_DEFAULT_HASH_METHOD = 'blake2b' if 'blake2b' in hashlib.algorithms_available else 'sha256'
+
+# Freshly initialized hashers for each method that has been used so far. Copying an initialized hasher is cheaper than
+# looking up and initializing a new one by name on every call
+_HASHER_TEMPLATES = {}  # type: Dict[str, Any]
+
+# Maximum number of types to keep in _SERIALIZERS
+_MAX_SERIALIZERS_SIZE = 1024
+
+# Cache of the encoded type names used in serializations (EG: for `strict_types=True`), up to _MAX_SERIALIZERS_SIZE types
+_TYPE_NAME_BYTES = {}  # type: Dict[type, bytes]
+
+# Marker pushed onto the serialization stack below a sequence's elements (and above its `seen` entry), to record where
+# the sequence ends in the buffer
+_SEQUENCE_END = object()
+
+# Non-cryptographic (but much faster) hashing methods from optional packages, mapping the method name to the
+# (module name, hasher constructor name). These are only imported the first time they are used
+_OPTIONAL_HASHERS = {
+    'blake3': ('blake3', 'blake3'),
+    'xxh3_64': ('xxhash', 'xxh3_64'),
+    'xxh3_128': ('xxhash', 'xxh3_128'),
+}
+
+# Bounded FIFO memo of recently hashed immutable objects, mapping (id(obj), method, strict_types) to (obj, digest).
+# Only str/bytes/tuple's are memoized (numbers are almost always new objects, so they would never hit the memo). Tuples
+# must only contain (recursively) objects of the exact types in _HASH_MEMO_ELEMENT_TYPES, which can never change, and
+# objects larger than _HASH_MEMO_MAX_OBJ_SIZE total elements/characters are not kept alive by the memo
+_HASH_MEMO = OrderedDict()  # type: OrderedDict[Tuple[int, str, bool], Tuple[Any, bytes]]
+_HASH_MEMO_MAX_SIZE = 4096
+_HASH_MEMO_MAX_OBJ_SIZE = 4096
+_HASH_MEMO_TYPES = frozenset({str, bytes, tuple})
+_HASH_MEMO_ELEMENT_TYPES = frozenset({NoneType, EllipsisType, NotImplementedType, bool, int, float, complex, str, bytes,
+    tuple})
+
+
+def hash_object(obj: 'Any', method: 'str' = _DEFAULT_HASH_METHOD, ret_type: 'Union[type, str]' = str,
     strict_types: bool = False) -> 'Union[int, str, Any]':
     """Hashes the given object.
 
     NOTE: this will generally take into account the type of the given object (either explicitly or implicitly)
 
+    NOTE: objects (or sub-objects) of types not listed at the top of this module raise a TypeError, rather than being
+    silently hashed to the same value as one another
+
     Args:
         obj (Any): the object to hash
-        method (Union[str, Hasher]): the string method to use to hash (a string name of a hasher object in hashlib)
+        method (Union[str, Hasher]): the string method to use to hash (a string name of a hasher object in hashlib).
+            Defaults to 'blake2b' (or 'sha256' if blake2b is unavailable). Pass 'sha256' if you need the same hashes as
+            previous versions. Can also be 'blake3', 'xxh3_64', or 'xxh3_128' if the optional `blake3`/`xxhash`
+            packages are installed, which are much faster for memoization keys but should not be used for security
         ret_type (Union[type, str]): the type to return the hash as. Can be a type (that will be called with the string
             .hexdigest() output), or a string for the type to use ('int', 'str', etc.)
         strict_types (bool): if True, then enforces objects to have the same types.
@@ -34,46 +85,284 @@ def hash_object(obj: 'Any', method: 'str' = 'sha256', ret_type: 'Union[type, str
     Returns:
         Union[int, str, Any]: the hash of the given object
     """
-    # Make sure `ret_type` is good
-    if isinstance(ret_type, str):
-        ret_type = ret_type.lower()
-    elif not callable(ret_type):
-        raise TypeError("`ret_type` should be a type or a str, not %s" % repr(type(ret_type).__name__))
+    # Make sure `ret_type` is good, and get the function to convert the digest into it
+    convert_digest = _get_digest_converter(ret_type)
     
-    # Make sure `method` is good and get the method from hashlib if using
-    if isinstance(method, str):
-        if method not in hashlib.algorithms_available:
-            raise ValueError("Unknown hasher method: %s" % repr(method))
-        hasher = getattr(hashlib, method)()
-    else:
+    # Make sure `method` is good
+    if not isinstance(method, str):
         raise TypeError("`method` should be a str object, not %s" % repr(type(method).__name__))
     
-    # Check for strict types
-    if strict_types:
-        hasher.update(("(%s) " % repr(type(obj).__name__)).encode('utf-8'))
+    # Check if we have recently hashed this exact immutable object. The memo holds a reference to the object itself, so
+    # its id() cannot be reused by another object while the entry is still in the memo. Objects are only checked to be
+    # memoizable before being added, since they can no longer change once they are
+    memo_key = None
+    if type(obj) in _HASH_MEMO_TYPES:
+        memo_key = (id(obj), method, strict_types)
+        memo_val = _HASH_MEMO.get(memo_key, None)
+        if memo_val is not None and memo_val[0] is obj:
+            return convert_digest(memo_val[1])
+    
+    digest = _hash_digest(obj, method, strict_types)
+
+    if memo_key is not None and _is_memoizable(obj):
+        _HASH_MEMO[memo_key] = (obj, digest)
+        if len(_HASH_MEMO) > _HASH_MEMO_MAX_SIZE:
+            _HASH_MEMO.popitem(last=False)
+    
+    return convert_digest(digest)
+
+
+def _hash_digest(obj, method, strict_types):
+    """Hashes the given object using the given string `method`, returning the raw bytes digest"""
+    hasher = _new_hasher(method)
+
+    # Serialize everything (including any sub-objects) into a single buffer so we only pay for one call into the
+    # hasher. Concatenating the bytes produces the exact same digest as updating the hasher with each piece separately
+    buf = bytearray()
+    _serialize(obj, buf, strict_types)
+
+    hasher.update(buf)
+    return hasher.digest()
+
+
+def _serialize(obj, buf, strict_types):
+    """Appends the serialization of `obj` (and all of its sub-objects) onto the bytearray `buf`
+    
+    Objects are serialized from an explicit stack rather than recursively, so deeply nested objects cannot hit the
+    recursion limit. Each serializer is called with `(obj, buf, strict_types, seen, stack)`. Serializers of containers
+    push their elements onto `stack` in reverse order, so they are popped (and serialized) in order.
+    
+    `seen` maps the id() of every sequence serialized so far in this call to [sequence, start, end], its span within
+    `buf` (with an end of None while it is still being serialized). The sequence itself is kept in the entry so that
+    its id() cannot be reused by a temporary object created later in the call.
+    """
+    seen = {}
+    stack = [obj]
+    pop, get_serializer, sequence_end = stack.pop, _SERIALIZERS.get, _SEQUENCE_END
+    while stack:
+        obj = pop()
+
+        # The end of a sequence, whose `seen` entry was pushed just below this marker
+        if obj is sequence_end:
+            pop()[2] = len(buf)
+            continue
+
+        # Check for strict types
+        if strict_types:
+            buf += b'(%s) ' % _type_name_bytes(type(obj))
+
+        # Check types to hash, looking up the exact type first and only falling back to isinstance() checks if needed
+        get_serializer(type(obj), _serialize_fallback)(obj, buf, strict_types, seen, stack)
+
+
+def _type_name_bytes(t):
+    """Returns the utf-8 encoded repr() of the name of the type `t`, caching it for later calls"""
+    name = _TYPE_NAME_BYTES.get(t, None)
+    if name is None:
+        name = repr(t.__name__).encode('utf-8')
+        if len(_TYPE_NAME_BYTES) < _MAX_SERIALIZERS_SIZE:
+            _TYPE_NAME_BYTES[t] = name
+    return name
+
+
+def _serialize_singleton(obj, buf, strict_types, seen, stack):
+    """Serializes built-in singleton objects (None, Ellipsis, NotImplemented)"""
+    buf += b'(%s)' % _type_name_bytes(type(obj))
+
+
+def _serialize_numeric(obj, buf, strict_types, seen, stack):
+    """Serializes numeric objects. They are converted to complex's that way all values are equal no matter format"""
+    buf += ("(Numeric) %s" % str(complex(obj))).encode('utf-8')
+
+
+def _serialize_real(obj, buf, strict_types, seen, stack):
+    """Serializes int/float's, producing the exact same bytes as _serialize_numeric() without building a complex
+    
+    str() of a complex with a zero imaginary part is the repr() of its real part (without any trailing '.0') in the
+    form '(REAL+0j)', except for a real part of positive zero which is just '0j'.
+    """
+    real = repr(float(obj))
+    if real.endswith('.0'):
+        real = real[:-2]
+    buf += b'(Numeric) 0j' if real == '0' else ('(Numeric) (%s+0j)' % real).encode('utf-8')
+
+
+def _serialize_str(obj, buf, strict_types, seen, stack):
+    """Serializes str's. The length prefix keeps strings from running into whatever is serialized after them"""
+    data = obj.encode('utf-8', 'surrogatepass')
+    buf += b'(Str) %d ' % len(data)
+    buf += data
+
 
-    # Check types to hash
+def _serialize_bytes(obj, buf, strict_types, seen, stack):
+    """Serializes bytes/bytearray's"""
+    buf += b'(Bytes) %d ' % len(obj)
+    buf += obj
+
+
+def _serialize_sequence(obj, buf, strict_types, seen, stack):
+    """Serializes list/tuple's, pushing their elements (followed by a _SEQUENCE_END marker) onto the stack
+    
+    Sequences that appear more than once in the object being hashed are only walked the first time. Later appearances
+    copy their already serialized bytes.
+    """
+    entry = seen.get(id(obj), None)
+    if entry is not None:
+        _, start, end = entry
+        if end is None:
+            raise ValueError("Cannot hash self-referential object of type %s" % repr(type(obj).__name__))
+        buf += buf[start:end]
+        return
+    
+    entry = seen[id(obj)] = [obj, len(buf), None]
+    buf += b'(Sequence) %d ' % len(obj)
+    stack.append(entry)
+    stack.append(_SEQUENCE_END)
+    
+    # reversed() skips any __iter__() that subclasses may have overridden, so only use it on the exact types
+    stack.extend(reversed(obj) if type(obj) in (list, tuple) else reversed(list(obj)))
+
+
+def _serialize_enum(obj, buf, strict_types, seen, stack):
+    """Serializes Enum's"""
+    buf += b'(Enum) %s ' % _type_name_bytes(type(obj))
+    buf += obj.name.encode('utf-8')
+
+
+def _serialize_unknown(obj, buf, strict_types, seen, stack):
+    """Objects of unknown types cannot be hashed. Serializing them to nothing would make, EG: [{'a': 1}] and [set()]
+    hash to the same value"""
+    raise TypeError("Cannot hash object of unsupported type %s" % repr(type(obj).__name__))
+
+
+def _serialize_fallback(obj, buf, strict_types, seen, stack):
+    """Serializes objects whose exact type is not in _SERIALIZERS (subclasses, Enum's, unknown types, etc.)
+    
+    The serializer chosen is then cached in _SERIALIZERS for the exact type of `obj`, that way these isinstance() checks
+    only happen once per type.
+    """
     # Built-in singleton objects
-    if any(obj is x for x in SingletonObjects):
-        hasher.update(("(%s)" % repr(type(obj).__name__)).encode('utf-8'))
+    if id(obj) in SINGLETON_IDS:
+        return _serialize_singleton(obj, buf, strict_types, seen, stack)
 
     # Numeric types
     elif isinstance(obj, (int, float, complex, np.number)):
-        # Make sure objects are converted to complex's if needed that way all values are equal no matter format
-        hasher.update(("(Numeric) %s" % str(complex(obj))).encode('utf-8'))
+        serializer = _serialize_numeric
     
-    # Enum's
+    # Enum's. These are checked before str's since Enum's may also subclass str
     elif isinstance(obj, Enum):
-        hasher.update(("(Enum) %s %s" % (repr(type(obj).__name__), obj.name)).encode('utf-8'))
-
-    # Get the hash, and convert into the expected type
-    if ret_type is str or ret_type in ['str', 'string']:
-        return hasher.hexdigest()
-    elif ret_type is int or ret_type in ['int', 'integer']:
-        return int(hasher.hexdigest(), 16)
-    elif ret_type is bytes or ret_type in ['byte', 'bytes']:
-        return hasher.digest()
-    elif not isinstance(ret_type, str):
-        return ret_type(hasher.hexdigest())
+        serializer = _serialize_enum
+    
+    elif isinstance(obj, str):
+        serializer = _serialize_str
+    
+    elif isinstance(obj, (bytes, bytearray)):
+        serializer = _serialize_bytes
+    
+    elif isinstance(obj, (list, tuple)):
+        serializer = _serialize_sequence
+    
     else:
-        raise ValueError("Unknown ret_type: %s" % repr(ret_type))
\ No newline at end of file
+        serializer = _serialize_unknown
+    
+    cache_exact_type(_SERIALIZERS, obj, serializer, _MAX_SERIALIZERS_SIZE)
+    serializer(obj, buf, strict_types, seen, stack)
+
+
+# Maps exact types to the functions used to serialize them for hashing, including all of the concrete numpy scalar types.
+# Types not in here have their serializer determined by _serialize_fallback(), which then adds them to this table (up to
+# _MAX_SERIALIZERS_SIZE types)
+_SERIALIZERS = {
+    NoneType: _serialize_singleton,
+    EllipsisType: _serialize_singleton,
+    NotImplementedType: _serialize_singleton,
+    bool: _serialize_numeric,
+    int: _serialize_real,
+    float: _serialize_real,
+    complex: _serialize_numeric,
+    str: _serialize_str,
+    bytes: _serialize_bytes,
+    bytearray: _serialize_bytes,
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+}
+_SERIALIZERS.update(dict.fromkeys({t for t in np.sctypeDict.values() if issubclass(t, np.number)}, _serialize_numeric))
+
+
+def _digest_to_int(digest):
+    """Converts the raw bytes `digest` into an int"""
+    return int.from_bytes(digest, 'big')
+
+
+def _digest_to_bytes(digest):
+    """Returns the raw bytes `digest` as-is"""
+    return digest
+
+
+# Maps the known `ret_type` values to the functions converting a raw bytes digest into that type
+_DIGEST_CONVERTERS = {
+    str: bytes.hex, 'str': bytes.hex, 'string': bytes.hex,
+    int: _digest_to_int, 'int': _digest_to_int, 'integer': _digest_to_int,
+    bytes: _digest_to_bytes, 'byte': _digest_to_bytes, 'bytes': _digest_to_bytes,
+}
+
+
+def _get_digest_converter(ret_type):
+    """Returns the function to convert a raw bytes digest into the given `ret_type`"""
+    if isinstance(ret_type, str):
+        converter = _DIGEST_CONVERTERS.get(ret_type.lower(), None)
+        if converter is None:
+            raise ValueError("Unknown ret_type: %s" % repr(ret_type))
+        return converter
+    elif not callable(ret_type):
+        raise TypeError("`ret_type` should be a type or a str, not %s" % repr(type(ret_type).__name__))
+    
+    if isinstance(ret_type, type) and ret_type in _DIGEST_CONVERTERS:
+        return _DIGEST_CONVERTERS[ret_type]
+    
+    # Any other callables are called with the hex digest
+    return lambda digest: ret_type(digest.hex())
+
+
+def _is_memoizable(obj):
+    """Returns True if `obj` is a str/bytes, or a tuple only containing objects of the exact (immutable) types in
+    _HASH_MEMO_ELEMENT_TYPES, that in total is no larger than _HASH_MEMO_MAX_OBJ_SIZE elements/characters"""
+    budget = _HASH_MEMO_MAX_OBJ_SIZE
+    stack = [obj]
+    while stack:
+        sub_obj = stack.pop()
+        if type(sub_obj) not in _HASH_MEMO_ELEMENT_TYPES:
+            return False
+        elif type(sub_obj) is tuple:
+            stack.extend(sub_obj)
+            budget -= len(sub_obj)
+        elif type(sub_obj) in (str, bytes):
+            budget -= len(sub_obj)
+        
+        if budget < 0:
+            return False
+    return True
+
+
+def _new_hasher(method):
+    """Returns a new, empty hasher for the given string `method`, copying it from a cached template hasher"""
+    template = _HASHER_TEMPLATES.get(method, None)
+    if template is None:
+        if method in _OPTIONAL_HASHERS:
+            template = _new_optional_hasher(method)
+        elif method not in hashlib.algorithms_available:
+            raise ValueError("Unknown hasher method: %s" % repr(method))
+        else:
+            template = hashlib.new(method)
+        _HASHER_TEMPLATES[method] = template
+    return template.copy()
+
+
+def _new_optional_hasher(method):
+    """Imports and initializes a new hasher from one of the optional packages in _OPTIONAL_HASHERS"""
+    module_name, constructor_name = _OPTIONAL_HASHERS[method]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        raise ValueError("Hasher method %s requires the optional package %s to be installed" % (repr(method), repr(module_name)))
+    return getattr(module, constructor_name)()
@@ -2,24 +2,102 @@
 Contains methods involving memory in python.
 """
 
+import sys
+import numpy as np
+from collections import deque
+from .pytypes import FunctionType, BuiltinFunctionType, MethodType, ModuleType
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
-    from typing import Any, Set
+    from typing import Any, Dict, Set, Optional, Tuple
 
 
-def memory_usage(*objs: 'Any', _checked_objs: 'Set[int]' = None) -> 'int':
+# Types whose size is counted, but whose references are not followed. These are generally shared across the whole
+# program (and following a module/function's globals would end up counting most of the interpreter)
+_NO_TRAVERSE_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+# Cache of type -> tuple of __slots__ attribute names, holding at most _MAX_SLOTS_CACHE_SIZE types
+_SLOTS_CACHE = {}  # type: Dict[type, Tuple[str, ...]]
+_MAX_SLOTS_CACHE_SIZE = 1024
+
+
+def memory_usage(*objs: 'Any', _checked_objs: 'Optional[Set[int]]' = None) -> 'int':
     """Returns the memory usage in bytes of all of the given objects
 
-    
+    This is the sum of sys.getsizeof() on the given objects and every object they reference (elements of lists, tuples,
+    sets, and frozensets, keys and values of dictionaries, elements of object numpy arrays, the arrays that numpy views
+    are viewing into, and instance attributes in __dict__/__slots__), counting each object only once. Classes, modules,
+    and functions are counted, but their references are not followed.
 
-    
+    Objects are traversed using an explicit stack rather than recursion, so deeply nested objects cannot hit the
+    recursion limit.
 
     Args:
-        _checked_objs (Set[int], optional): set of object id's that have already been checked
+        _checked_objs (Optional[Set[int]]): set of object id's that have already been checked. These will not be
+            counted, and the id's of all objects counted here will be added to it. Defaults to None.
 
     Returns:
-        int: _description_
+        int: the total memory usage in bytes
     """
-    pass
\ No newline at end of file
+    checked = set() if _checked_objs is None else _checked_objs
+    stack = deque(objs)
+    total = 0
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in checked:
+            continue
+        checked.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, _NO_TRAVERSE_TYPES):
+            continue
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+
+        # sys.getsizeof() already includes the data buffer of numpy arrays that own their data, so only views need to
+        # count the object they view into. Object arrays hold references to each of their elements
+        elif isinstance(obj, np.ndarray):
+            if obj.base is not None:
+                stack.append(obj.base)
+            if obj.dtype == object:
+                stack.extend(obj.flat)
+
+        # Instance attributes
+        if hasattr(obj, '__dict__') and isinstance(obj.__dict__, dict):
+            stack.append(obj.__dict__)
+        for slot in _get_slots(type(obj)):
+            if hasattr(obj, slot):
+                stack.append(getattr(obj, slot))
+
+    return total
+
+
+def _get_slots(t):
+    """Returns the names of all __slots__ attributes defined on the type `t` and its base classes"""
+    slots = _SLOTS_CACHE.get(t, None)
+    if slots is None:
+        slots = _find_slots(t)
+        if len(_SLOTS_CACHE) < _MAX_SLOTS_CACHE_SIZE:
+            _SLOTS_CACHE[t] = slots
+    return slots
+
+
+def _find_slots(t):
+    """Finds the names of all __slots__ attributes defined on the type `t` and its base classes"""
+    slots = []
+    for base in t.__mro__:
+        base_slots = base.__dict__.get('__slots__', ())
+        for s in ([base_slots] if isinstance(base_slots, str) else base_slots):
+            if s in ('__dict__', '__weakref__'):
+                continue
+
+            # Private names are mangled with the name of the class that defined them
+            if s.startswith('__') and not s.endswith('__'):
+                s = '_%s%s' % (base.__name__.lstrip('_'), s)
+            slots.append(s)
+    return tuple(slots)
@@ -1,7 +1,6 @@
 """
 Miscellaneous functions that don't have a set home
 """
-import time
 from threading import Thread
 from typing import TYPE_CHECKING
 
@@ -47,15 +46,10 @@ def timeout_wrapper(timeout: 'float' = 3, timeout_ret_val: 'Any' = None):
             thread = _TimeoutFuncThread(func, *args, **kwargs)
             thread.start()
 
-            init_time = time.time()
-            sleep_time = 1e-8
-            while time.time() - init_time < timeout:
-                if thread.is_alive():
-                    print("Sleeping for:", sleep_time)
-                    time.sleep(sleep_time)
-                    sleep_time = min(0.1, sleep_time * 1.05)
-                else:
-                    return thread._return
+            # Block until the thread finishes or we time out
+            thread.join(timeout)
+            if not thread.is_alive():
+                return thread._return
 
             # If we make it here, there is an error, return value
             return timeout_ret_val
@@ -16,6 +16,7 @@ from enum import Enum
 from itertools import product
 import numpy as np
 import copy
+import pickle
 
 
 class _TempEnum(Enum):
@@ -153,13 +154,53 @@ def test_sequences():
 
     types = (list, tuple, lambda x: np.array(x, dtype=object))
 
+    # equal() never modifies its arguments, so each value only needs to be copied once
+    val_copies = [copy.deepcopy(v) for v in vals]
     for t1, t2 in product(types, repeat=2):
-        for v in vals:
-            _check_equal(t1(v), t2(copy.deepcopy(v)), raise_err=True)
+        for v, v_copy in zip(vals, val_copies):
+            _check_equal(t1(v), t2(v_copy), raise_err=True)
     
     # Checking numpy sequences
     _check_equal(np.array([1, 2, 3], dtype=np.int32), np.array([1, 2, 3], dtype=np.float64))
     _check_equal(np.array([1, 2, 3], dtype=np.complex128), np.array([1, 2, 3], dtype=np.float64))
+    _check_equal([1, 2, 3], np.array([1, 2, 3]))
+    _check_equal(np.array([1, 2, 3]), [1, 2, 3])
+    _check_equal([1, 2, 3], np.array([1, 2, 4]), expected_value=False)
+    _check_equal(np.array([1, 2, 3]), [1, 2, 4], expected_value=False)
+    _check_equal(np.zeros((2, 3)), np.zeros((3, 2)), expected_value=False)
+    _check_equal(np.zeros(6), np.zeros((2, 3)), expected_value=False)
+    _check_equal(np.zeros((1, 3)), np.zeros(3), expected_value=False)
+    _check_equal(np.array([1, np.nan]), np.array([1, np.nan], dtype=np.float32))
+    _check_equal(np.array([np.nan, 1]), np.array([1, np.nan]), unordered=True)
+    _check_equal(np.array([1, np.nan]), np.array([1, 2]), expected_value=False)
+    _check_equal(np.array([complex(np.nan, 1)]), np.array([complex(np.nan, 1)]))
+    _check_equal(np.array([complex(np.nan, 1)]), np.array([complex(1, np.nan)]), expected_value=False)
+    _check_equal(np.array([complex(1, 2)]), np.array([complex(1, 3)]), expected_value=False)
+    _check_equal(np.array([complex(1, 2)]), np.array([1.0]), expected_value=False)
+
+    try:
+        equal(np.arange(4).reshape(2, 2), np.array([[0, 1], [2, 5]]), raise_err=True)
+        raise AssertionError("Expected an EqualityError")
+    except EqualityError as e:
+        assert 'first at index (1, 1): ' in str(e)
+
+    # Checking sequences of a single simple type
+    _check_equal(list(range(100)), tuple(range(100)))
+    _check_equal(list(range(100)), [float(x) for x in range(100)])
+    _check_equal(['a', 'b', 'c'], ('a', 'b', 'c'))
+    _check_equal(list(range(100)), list(range(99)) + [100], expected_value=False)
+    _check_equal(['a', 'b', 'c'], [b'a', b'b', b'c'], expected_value=False)
+    _check_equal([True, False], [1, 0], expected_value=False)
+
+    # Checking sequences of mixed plain numbers
+    _check_equal([1, 2.0, 3 + 0j], (1.0, 2, 3))
+    _check_equal([1, 2.0, 3], [1, 2, 3], strict_types=True, expected_value=False)
+    _check_equal([1, 2.5], [1, True], expected_value=False)
+
+    # Checking sequences against generators
+    _check_equal([1, [2, 3]], (x for x in [1, (2, 3)]))
+    _check_equal([1, 2], (x for x in [1, 2, 3]), expected_value=False)
+    _check_equal([1, 2, 3], (x for x in [1, 2]), expected_value=False)
 
 
 def test_sets():
@@ -174,10 +215,11 @@ def test_sets():
     _check_equal(set(range(10)), set([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
 
     for s in set_vals:
+        s_copy = copy.deepcopy(s)
         for t1, t2 in product([set, frozenset], repeat=2):
             for strict_types, unordered in product([True, False], [False]):
                 exp = t1 is t2 or not strict_types
-                _check_equal(t1(s), t2(copy.deepcopy(s)), strict_types=strict_types, unordered=unordered, expected_value=exp, 
+                _check_equal(t1(s), t2(s_copy), strict_types=strict_types, unordered=unordered, expected_value=exp, 
                     message="used strict_types=%s with types '%s' and '%s' and thus expected value: %s"
                         % (strict_types, t1.__name__, t2.__name__, not strict_types))
 
@@ -191,8 +233,44 @@ def test_dictionaries():
     ]
 
     for d in dict_vals:
+        d_copy = copy.deepcopy(d)
         for strict_types, unordered in product([True, False], [False]):
-            _check_equal(d, copy.deepcopy(d), strict_types=strict_types, unordered=unordered)
+            _check_equal(d, d_copy, strict_types=strict_types, unordered=unordered)
+
+
+def test_unordered():
+    """Tests sequences with `unordered=True`"""
+    _check_equal([1, 2, 3], [3, 1, 2], unordered=True)
+    _check_equal([1, 2, 3], (3, 1, 2.0), unordered=True)
+    _check_equal(['a', 'b', 'b'], ('b', 'a', 'b'), unordered=True)
+    _check_equal([[1, 2], {'a': 1}, 'b'], ['b', (2, 1), {'a': 1}], unordered=True)
+    _check_equal([True, 1], [1, True], unordered=True)
+    _check_equal(np.array([3, 1, 2]), [1, 2, 3], unordered=True)
+    _check_equal([3, 1, 2], np.array([1, 2, 3]), unordered=True)
+    _check_equal((3, 1, 2), np.array([1, 2, 3]), unordered=True)
+    _check_equal({'a': 1, 'b': [2, 3]}.values(), {'c': [3, 2], 'd': 1}.values())
+
+    _check_equal([1, 2, 3], [3, 1, 2], expected_value=False)
+    _check_equal([1, 1, 2], [1, 2, 2], unordered=True, expected_value=False)
+    _check_equal([True, True], [1, 1], unordered=True, expected_value=False)
+    _check_equal(np.array([3, 1, 1]), [1, 3, 3], unordered=True, expected_value=False)
+    _check_equal([1, 3, 3], np.array([3, 1, 1]), unordered=True, expected_value=False)
+    _check_equal([[1, 2], 'b'], ['b', (2, 1)], unordered=True, strict_types=True, expected_value=False)
+
+
+def test_self_referential():
+    """Tests containers that contain themselves"""
+    a, b, c = [1], [1], [2]
+    a.append(a)
+    b.append(b)
+    c.append(c)
+    _check_equal(a, b)
+    _check_equal({'x': a}, {'x': b})
+    _check_equal(a, c, expected_value=False)
+
+    d, e = {'a': 1}, {'a': 1}
+    d['self'], e['self'] = d, e
+    _check_equal(d, e)
 
 
 def test_custom_eq():
@@ -202,6 +280,29 @@ def test_custom_eq():
     _check_equal(_TempHashableEQ(2, ''), _TempHashableEQ(2, 'a'), expected_value=False)
 
 
+def test_selector():
+    """Tests checking equality of sub-objects using `selector`"""
+    a = _TempHashableEQ(1, 'a', [1, 2, {'x': 3}])
+    b = _TempHashableEQ(2, 'b', [1, 2, {'x': 3}])
+    _check_equal(a, b, selector='list_val')
+    _check_equal(a, b, selector='.list_val[2]["x"]')
+    _check_equal(a, b, selector='int_val', expected_value=False)
+    _check_equal([1, 2, 3], (0, 2, 3), selector='[1:]')
+    _check_equal([1, 2, 3], (0, 2, 3), selector='[0]', expected_value=False)
+    _check_equal(np.array([[1, 2, 3], [4, 5, 6]]), np.array([[0, 2, 3], [4, 5, 0]]), selector='[0, 1:]')
+    _check_equal(np.array([[1, 2, 3], [4, 5, 6]]), np.array([[0, 2, 3], [4, 5, 0]]), selector='[:, 1]')
+    _check_equal(np.array([[1, 2, 3], [4, 5, 6]]), np.array([[0, 2, 3], [4, 5, 0]]), selector='[1, 1:]', expected_value=False)
+    _check_equal({(1, 2): 'a'}, {(1, 2): 'a', 3: 'b'}, selector='[1, 2]')
+
+    # Only attribute access and literal subscripts are allowed
+    for selector in ['.keys()', '[x]', '[1 + 1]', '.a + 1', '[1]()', '.a.b(']:
+        try:
+            equal({'a': 1}, {'a': 1}, selector=selector)
+            raise AssertionError("Expected a ValueError for selector %s" % repr(selector))
+        except ValueError:
+            pass
+
+
 def test_passing_kwargs_to_subcalls():
     """Tests how passing kwargs to subcalls of equal() works"""
     _check_equal(_TempHashableEQ(16, 'aa', [1, 2, 3]), _TempHashableEQ(16, 'aa', [1, 2, np.array([3])[0]]), strict_types=False)
@@ -209,6 +310,35 @@ def test_passing_kwargs_to_subcalls():
     _check_equal(_TempHashableEQ(16, 'aa', [1, 2, 3], [1, 2]), _TempHashableEQ(16, 'aa', [1, 2, np.array([3])[0]], [1, np.array([2])[0]]), strict_types=False, expected_value=False)
 
 
+def test_errors():
+    """Tests the EqualityError's raised with `raise_err=True`"""
+    a = [1]
+    try:
+        equal(a, [2], raise_err=True)
+        raise AssertionError("Expected an EqualityError")
+    except EqualityError as e:
+        err = e
+    
+    # The message should describe the objects when they were checked, and stay bounded for large objects
+    a[0] = 2
+    assert 'a: [1]' in str(err)
+    try:
+        equal(list(range(100000)), list(range(99999)) + [5], raise_err=True)
+        raise AssertionError("Expected an EqualityError")
+    except EqualityError as e:
+        assert len(repr(e)) < 1000
+    
+    err = pickle.loads(pickle.dumps(err))
+    assert 'a: [1]' in str(err)
+
+    # Large containers compared against empty ones should still raise (with a bounded message)
+    try:
+        equal(list(range(2000)), [], raise_err=True)
+        raise AssertionError("Expected an EqualityError")
+    except EqualityError as e:
+        assert len(str(e)) < 1000
+
+
 def test_not_equal():
     """Tests that all of these objects are definitively not equal to eachother"""
     olists = [
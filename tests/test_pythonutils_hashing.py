@@ -0,0 +1,180 @@
+"""
+Tests for the gstats_utils.pythonutils.hashing file.
+"""
+from gstatsutils.pythonutils import hashing
+from gstatsutils.pythonutils.hashing import hash_object
+from enum import Enum
+import numpy as np
+import pytest
+
+
+class _TempEnum(Enum):
+    A = 0
+    B = 'b'
+
+
+# sha256 digests of scalar objects from before str/bytes/sequence support was added, as (digest, strict_types digest)
+_SCALAR_SHA256_DIGESTS = [
+    (None, '871d3f9e7c6f8224c3df4f93c6bdc8e8f101df358a3061b514debd263d0128dd',
+        '7aebbe77e8046f870552f6df3c3c50963571a10155ae799cf6659bf69ae1d949'),
+    (Ellipsis, '384e8736f182d1c4251ce45d5b153803b3cf96824df6a414798174546f035303',
+        '307804e6b52edb3233aa605595bd1046dd3e3c823878f0d9665da6c8cc92d2fb'),
+    (1, '2eb4e8cb63392effb64bf24b86f1a97dbcabf89e0a5847101fa6b681dbac3ad2',
+        'f9b519cefe6ececaa4ddaf5e2b248d3832173cbde21b0e0b1f2c2d87e29944d9'),
+    (2.5, 'ada21f7306d385e7e9e21731149f2dbcffcf7c7771f4d359aa96d50fa7740953',
+        'e71c13889b68a744515f2a1a8f63219c9bbeadfd32c0e3c32decd01e1ecc5fa2'),
+    (-0.0, 'dc543109489960781004e9d82c5100f032fe4c84c53dd7f22489894277ed0c9b',
+        '7e79ff7c82ab978b13980c9785829f8f8c3140541f9ece5fcaf64e9a34390411'),
+    (float('nan'), '86273b9ff5f77873745bec63bb50c1a5359c65f07c10ae50dc93658ba449d965',
+        '8a4c455bafc7cdd685c4552235358b68b51cc31c66b7a6b95acd528478a91a87'),
+    (complex(1, 2), '2506142e93ff551276da13003dceb1914c314b5f4c78cf433afeda37a53980a0',
+        '18f28ba8c0fe49db883b9170f0a1a67045badded10ae101b23e7a34f88fc693c'),
+    (np.int32(7), '4227e8df3de05e640f72e2f9062408acdfacac965a284ed44c5b13737b8503ba',
+        'af116b97129381997b7fe3ce3a0cf61f27e16fa4b1654ca83fc99fe27fec2717'),
+    (_TempEnum.B, 'd5a4dccfcde743e145512d07c7a4b7a3cfd479e9d9df1f8fe890d128c5f2a6db',
+        'b6724a041d8ca749c349950cebaaef10b672dcd172427ba19adf68e4a8c18dc4'),
+]
+
+
+class _FreshTupleList(list):
+    """A list whose iteration yields a new 1-tuple for each element, that are freed once they have been hashed"""
+    def __iter__(self):
+        for x in list.__iter__(self):
+            yield (x,)
+
+
+class _HashableList(list):
+    """A mutable list that can still be used with the builtin hash()"""
+    def __hash__(self):
+        return 0
+
+
+def test_memo():
+    """Tests that hashing the same object again does not return a stale digest once it has changed"""
+    hl = _HashableList([1])
+    t = (hl,)
+    old_hash = hash_object(t)
+    hl.append(2)
+    assert hash_object(t) != old_hash
+    assert hash_object(t) == hash_object(([1, 2],))
+
+    t = ('a', (1, 2.0))
+    assert hash_object(t) == hash_object(t) == hash_object(['a', [1, 2]])
+
+
+def test_repeated_sequences():
+    """Tests sequences that appear multiple times in (or as temporaries while hashing) the same object"""
+    x = [1, 'a']
+    assert hash_object([x, x, (x,)]) == hash_object([[1, 'a'], [1, 'a'], ([1, 'a'],)])
+    assert hash_object([x, x], strict_types=True) == hash_object([[1, 'a'], [1, 'a']], strict_types=True)
+
+    # Temporaries can have the id() of an earlier, already freed temporary
+    assert hash_object(_FreshTupleList([1, 2, 3])) == hash_object([(1,), (2,), (3,)])
+    assert hash_object(_FreshTupleList([1, 2, 3])) != hash_object([(1,), (2,), (1,)])
+
+
+def test_scalar_digests():
+    """Tests that scalar objects still hash to the same sha256 digests as before"""
+    for obj, digest, strict_digest in _SCALAR_SHA256_DIGESTS:
+        assert hash_object(obj, method='sha256') == digest, repr(obj)
+        assert hash_object(obj, method='sha256', strict_types=True) == strict_digest, repr(obj)
+
+
+def test_str_bytes():
+    """Tests hashing str's and bytes-like objects"""
+    vals = ['', 'a', 'b', 'ab', 'a\u00e9', b'', b'a', b'ab']
+    assert len(set(hash_object(v) for v in vals)) == len(vals)
+    assert hash_object(b'ab') == hash_object(bytearray(b'ab'))
+    assert hash_object(b'ab', strict_types=True) != hash_object(bytearray(b'ab'), strict_types=True)
+    assert hash_object('1') != hash_object(1)
+
+
+def test_sequences():
+    """Tests hashing list/tuple's"""
+    assert hash_object([1, 2]) == hash_object((1, 2)) == hash_object([1.0, 2 + 0j])
+    assert hash_object([1, 2], strict_types=True) != hash_object((1, 2), strict_types=True)
+    assert hash_object([[1], 'a', None]) == hash_object(((1,), 'a', None))
+
+    # Sequences whose contents concatenate to the same thing should still differ
+    unequal = [[], [[]], ['a', 'b'], ['ab'], ['a', 'b', ''], [b'a', b'b'], [[1, 2], 3], [1, [2, 3]], [1, 2, 3]]
+    assert len(set(hash_object(v) for v in unequal)) == len(unequal)
+
+
+def test_unsupported_types():
+    """Tests that objects of unsupported types raise an error instead of all hashing to the same value"""
+    for obj in [{'a': 1}, set(), object(), [1, {'b': 2}], ([], (set(),))]:
+        with pytest.raises(TypeError):
+            hash_object(obj)
+        with pytest.raises(TypeError):
+            hash_object(obj, strict_types=True)
+
+
+def test_self_referential():
+    """Tests that hashing self-referential objects raises an error instead of recursing forever"""
+    a = [1]
+    a.append(a)
+    with pytest.raises(ValueError):
+        hash_object(a)
+    with pytest.raises(ValueError):
+        hash_object((a,))
+
+
+def test_optional_hashers(monkeypatch):
+    """Tests that optional hashers whose package is not installed raise a ValueError"""
+    monkeypatch.setitem(hashing._OPTIONAL_HASHERS, '_missing', ('_gstatsutils_missing_package', 'new'))
+    with pytest.raises(ValueError, match='_gstatsutils_missing_package'):
+        hash_object(1, method='_missing')
+    assert '_missing' not in hashing._HASHER_TEMPLATES
+
+    with pytest.raises(ValueError):
+        hash_object(1, method='_not_a_hasher')
+
+
+def test_deep_nesting():
+    """Tests that deeply nested sequences do not hit the recursion limit"""
+    a, b = [], ()
+    for _ in range(20000):
+        a, b = [a], (b,)
+    assert hash_object(a) == hash_object(b)
+    assert hash_object(a) != hash_object([a])
+
+    a.append(a)
+    with pytest.raises(ValueError):
+        hash_object([a])
+
+
+def test_ret_type():
+    """Tests the types hashes can be returned as"""
+    hex_digest = hash_object('a', method='sha256')
+    assert isinstance(hex_digest, str) and len(hex_digest) == 64
+    assert int(hex_digest, 16) >= 0
+
+    for ret_type in [str, 'str', 'string', 'STR']:
+        assert hash_object('a', method='sha256', ret_type=ret_type) == hex_digest
+    for ret_type in [int, 'int', 'integer', 'INT']:
+        assert hash_object('a', method='sha256', ret_type=ret_type) == int(hex_digest, 16)
+    for ret_type in [bytes, 'bytes', 'byte']:
+        assert hash_object('a', method='sha256', ret_type=ret_type) == bytes.fromhex(hex_digest)
+    
+    # Other callables are called with the hex digest
+    assert hash_object('a', method='sha256', ret_type=lambda x: ('custom', x)) == ('custom', hex_digest)
+    assert hash_object('a', method='sha256', ret_type=list) == list(hex_digest)
+
+    # Results returned from the memo should be converted the same way
+    obj = ('a', 1)
+    assert hash_object(obj, ret_type=int) == hash_object(obj, ret_type=int) == int(hash_object(obj), 16)
+
+    with pytest.raises(ValueError):
+        hash_object('a', ret_type='float')
+    with pytest.raises(TypeError):
+        hash_object('a', ret_type=5)
+
+
+def test_default_method():
+    """Tests that the default hashing method is blake2b"""
+    for obj in [None, 1, 'a', b'a', [1, ('a', 2.5)], _TempEnum.A]:
+        assert hash_object(obj) == hash_object(obj, method='blake2b')
+        assert hash_object(obj, strict_types=True) == hash_object(obj, method='blake2b', strict_types=True)
+    assert len(hash_object(1)) == 128
+    assert hash_object(1) != hash_object(1, method='sha256')
+
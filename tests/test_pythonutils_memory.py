@@ -0,0 +1,83 @@
+"""
+Tests for the gstats_utils.pythonutils.memory file.
+"""
+from gstatsutils.pythonutils.memory import memory_usage
+import numpy as np
+import sys
+
+
+class _Slotted:
+    __slots__ = ('a', '__b')
+
+    def __init__(self, a, b):
+        self.a = a
+        self.__b = b
+
+
+class __Private(_Slotted):
+    __slots__ = '__c'
+
+    def __init__(self, a, b, c):
+        super().__init__(a, b)
+        self.__c = c
+
+
+def test_deep_nesting():
+    """Tests that deeply nested objects do not hit the recursion limit"""
+    a = []
+    for _ in range(100000):
+        a = [a]
+    assert memory_usage(a) == 100000 * sys.getsizeof([[]]) + sys.getsizeof([])
+
+
+def test_shared_objects():
+    """Tests that objects referenced multiple times are only counted once"""
+    shared = list(range(1000, 1100))
+    shared_size = memory_usage(shared)
+    assert memory_usage([shared, shared]) == sys.getsizeof([shared, shared]) + shared_size
+    assert memory_usage(shared, shared) == shared_size
+    assert memory_usage({'a': shared, 'b': (shared,)}) == \
+        memory_usage({'a': None, 'b': (None,)}) - sys.getsizeof(None) + shared_size
+
+    a = []
+    a.append(a)
+    assert memory_usage(a) == sys.getsizeof(a)
+
+
+def test_slots():
+    """Tests that __slots__ attributes are counted, including private (mangled) names"""
+    val_a, val_b, val_c = 'a' * 1000, 'b' * 2000, 'c' * 3000
+    obj = _Slotted(val_a, val_b)
+    assert memory_usage(obj) == sys.getsizeof(obj) + sys.getsizeof(val_a) + sys.getsizeof(val_b)
+
+    obj = __Private(val_a, val_b, val_c)
+    assert memory_usage(obj) == sys.getsizeof(obj) + sys.getsizeof(val_a) + sys.getsizeof(val_b) + \
+        sys.getsizeof(val_c)
+
+    # Unset slots should be skipped
+    obj = _Slotted.__new__(_Slotted)
+    assert memory_usage(obj) == sys.getsizeof(obj)
+
+
+def test_checked_objs():
+    """Tests that _checked_objs is not counted, and is carried over between calls"""
+    a, b = 'a' * 1000, 'b' * 1000
+    checked = set()
+    assert memory_usage([a], _checked_objs=checked) == sys.getsizeof([a]) + sys.getsizeof(a)
+    assert id(a) in checked
+    assert memory_usage([a, b], _checked_objs=checked) == sys.getsizeof([a, b]) + sys.getsizeof(b)
+    assert memory_usage(a, b, _checked_objs=checked) == 0
+
+
+def test_numpy():
+    """Tests that numpy arrays and views into them are only counted once"""
+    a = np.zeros(10000)
+    v = a[10:20]
+    assert memory_usage(a) == sys.getsizeof(a) > a.nbytes
+    assert memory_usage(v) == sys.getsizeof(v) + sys.getsizeof(a)
+    assert memory_usage(a, v) == memory_usage(v)
+    assert memory_usage([a, v]) == sys.getsizeof([a, v]) + memory_usage(v)
+
+    vals = ['a' * 1000, 'b' * 1000]
+    o = np.array(vals, dtype=object)
+    assert memory_usage(o) == sys.getsizeof(o) + sum(sys.getsizeof(x) for x in vals)
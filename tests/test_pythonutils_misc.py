@@ -0,0 +1,36 @@
+"""
+Tests for the gstats_utils.pythonutils.misc file.
+"""
+from gstatsutils.pythonutils.misc import timeout_wrapper
+from threading import Event
+import time
+
+
+def test_timeout_wrapper_returns():
+    """Tests that functions finishing before the timeout return their value"""
+    @timeout_wrapper(timeout=5, timeout_ret_val='timed out')
+    def add(a, b, c=0):
+        time.sleep(0.01)
+        return a + b + c
+    
+    start = time.perf_counter()
+    assert add(1, 2, c=3) == 6
+    assert time.perf_counter() - start < 2
+
+
+def test_timeout_wrapper_times_out():
+    """Tests that functions still running after the timeout return `timeout_ret_val` without waiting for them"""
+    finish = Event()
+
+    @timeout_wrapper(timeout=0.2, timeout_ret_val='timed out')
+    def slow():
+        finish.wait(5)
+        return 'finished'
+    
+    try:
+        start = time.perf_counter()
+        assert slow() == 'timed out'
+        elapsed = time.perf_counter() - start
+        assert 0.15 < elapsed < 2
+    finally:
+        finish.set()